@@ -1,22 +1,325 @@
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
-import json
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, constr
+import aiosqlite
+import anyio.to_thread
+import asyncio
+import atexit
+import gzip
+import hashlib
+from collections import deque
+import logging
+import logging.handlers
+import orjson
 import os
+import queue
+import time
 from datetime import datetime
 import uuid
 from typing import List, Optional
 
-print("FastAPI app initialization started...")
+# Logging lewat queue, supaya request tidak menunggu write ke stdout
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+# Per-request messages are logged at DEBUG, set LOG_LEVEL=DEBUG to see them
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+
+logger.info("FastAPI app initialization started...")
+
+# Hot-path callables bound once, saves the attribute lookups on every request
+_now = datetime.now
+_uuid4 = uuid.uuid4
+_monotonic = time.monotonic
+
+# Pydantic models
+# Fields are stripped (and the email lowercased) while parsing; the email
+# only gets a cheap shape check instead of a full email-validator parse
+class MessageCreate(BaseModel):
+    fullName: constr(strip_whitespace=True, max_length=200)
+    email: constr(strip_whitespace=True, to_lower=True, max_length=254, pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+    position: constr(strip_whitespace=True, max_length=200)
+    message: constr(strip_whitespace=True)
+
+# Database untuk menyimpan pesan
+DATABASE_FILE = os.environ.get('DATABASE_FILE', 'messages.db')
+MESSAGES_FILE = 'messages.json'  # Legacy JSON storage, imported once into the database
+MAX_MESSAGES = 10
+WAL_SIZE_LIMIT = 1024 * 1024  # bytes kept in messages.db-wal after a checkpoint
+GZIP_MINIMUM_SIZE = 512  # smaller responses are sent uncompressed
+GZIP_LEVEL = 5
+WRITE_RATE = 5  # POST /api/messages tokens refilled per second, per client IP
+WRITE_BURST = 5  # bucket size
+
+# Opened by the lifespan handler, shared by all requests
+db = None
+# Serializes transactions on the shared connection, so a rollback after a
+# failed write never discards another request's statements
+_db_lock = None
+
+# Latest messages kept in memory, newest first. Writes are committed first
+# and then applied to the deque, so it never holds uncommitted changes.
+_messages = deque(maxlen=MAX_MESSAGES)
+# id -> message for everything in _messages
+_index = {}
+# PRAGMA data_version the deque was loaded at. data_version changes when another
+# connection (another worker) commits.
+_messages_version = None
+
+# Serialized GET /api/messages body as (revision, bytes, gzipped bytes or None,
+# ETag), _revision is bumped on every change to _messages. The ETag is a hash
+# of the body so every worker hands out the same one for the same messages.
+_messages_cache = None
+_revision = 0
+
+def load_legacy_messages():
+    """Load messages from the legacy JSON file"""
+    try:
+        with open(MESSAGES_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+            logger.info("Loaded %d messages from %s", len(data), MESSAGES_FILE)
+            return data if isinstance(data, list) else []
+    except FileNotFoundError:
+        return []
+    except orjson.JSONDecodeError:
+        logger.warning("Error decoding JSON from %s. File might be empty or corrupted. Returning empty list.", MESSAGES_FILE)
+        return []
+    except Exception as e:
+        logger.error("Error loading messages from %s: %s", MESSAGES_FILE, e)
+        return []
+
+def normalize_legacy_message(msg):
+    """Fill in fields an older messages.json entry may lack, None for unusable entries"""
+    if not isinstance(msg, dict):
+        return None
+    timestamp = str(msg.get('timestamp') or '')
+    return {
+        "id": str(msg.get('id') or _uuid4()),
+        "fullName": str(msg.get('fullName') or ''),
+        "email": str(msg.get('email') or ''),
+        "position": str(msg.get('position') or ''),
+        "message": str(msg.get('message') or ''),
+        "timestamp": timestamp,
+        "created_at": str(msg.get('created_at') or timestamp[:19].replace('T', ' '))
+    }
+
+async def init_db():
+    """Open the database, create the messages table and import messages from the legacy JSON file"""
+    global db, _db_lock
+    _db_lock = asyncio.Lock()
+    db = await aiosqlite.connect(DATABASE_FILE)
+    try:
+        await setup_db()
+    except Exception:
+        # Stop the aiosqlite thread, otherwise the process hangs on exit
+        await db.close()
+        raise
+
+async def setup_db():
+    """Create the messages table and import messages from the legacy JSON file"""
+    db.row_factory = aiosqlite.Row
+    await db.execute("PRAGMA journal_mode=WAL")
+    # FULL syncs the WAL on every commit, so an acknowledged message survives
+    # a power loss; the WAL append keeps that to one sequential write
+    await db.execute("PRAGMA synchronous=FULL")
+    # Writes only append to the WAL; checkpoints fold it back into the
+    # database and the WAL file is truncated back down to this size
+    await db.execute(f"PRAGMA journal_size_limit={WAL_SIZE_LIMIT}")
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS messages (
+            id TEXT PRIMARY KEY,
+            fullName TEXT NOT NULL,
+            email TEXT NOT NULL,
+            position TEXT NOT NULL,
+            message TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    await db.execute("CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages (timestamp DESC)")
+    await db.commit()
+
+    legacy_messages = await anyio.to_thread.run_sync(load_legacy_messages)
+    legacy_messages = [msg for msg in map(normalize_legacy_message, legacy_messages) if msg is not None]
+    if legacy_messages:
+        await db.executemany(
+            "INSERT OR IGNORE INTO messages (id, fullName, email, position, message, timestamp, created_at) "
+            "VALUES (:id, :fullName, :email, :position, :message, :timestamp, :created_at)",
+            legacy_messages
+        )
+        await db.commit()
+        logger.info("Imported %d messages from %s into %s", len(legacy_messages), MESSAGES_FILE, DATABASE_FILE)
+    # Rename so deleted messages are not imported again on the next startup
+    try:
+        os.replace(MESSAGES_FILE, MESSAGES_FILE + '.migrated')
+    except FileNotFoundError:
+        pass  # No legacy file, or another worker already renamed it
+
+# Token buckets for POST /api/messages, client IP -> (tokens, last refill).
+# Per worker, so the effective limit is WRITE_RATE * workers. The client IP is
+# the connecting address: behind a proxy (Railway) that is the proxy itself,
+# making the limit global, unless Uvicorn is told to trust the proxy's
+# X-Forwarded-For through FORWARDED_ALLOW_IPS.
+_write_buckets = {}
+_write_buckets_swept = time.monotonic()
+
+def allow_write(client_ip):
+    """Take a token from the client's bucket, False if it is empty"""
+    global _write_buckets_swept
+    now = _monotonic()
+    if now - _write_buckets_swept >= 60:
+        # Forget clients whose bucket has refilled completely
+        full_after = WRITE_BURST / WRITE_RATE
+        for ip, (_, last) in list(_write_buckets.items()):
+            if now - last >= full_after:
+                del _write_buckets[ip]
+        _write_buckets_swept = now
+
+    tokens, last = _write_buckets.get(client_ip, (WRITE_BURST, now))
+    tokens = min(WRITE_BURST, tokens + (now - last) * WRITE_RATE)
+    if tokens < 1:
+        _write_buckets[client_ip] = (tokens, now)
+        return False
+    _write_buckets[client_ip] = (tokens - 1, now)
+    return True
+
+async def limit_writes(request: Request):
+    """Reject the request with 429 once the client's bucket is empty"""
+    client_ip = request.client.host if request.client else "unknown"
+    if not allow_write(client_ip):
+        raise HTTPException(status_code=429, detail="Too many messages, please slow down")
+
+def messages_changed():
+    """Invalidate the cached GET /api/messages body after _messages changed"""
+    global _revision
+    _revision += 1
+
+def add_message(message):
+    """Insert a message into _messages, keeping it newest first without sorting"""
+    # Timestamps only grow within a process, so a new message normally goes
+    # straight to the front; only a clock stepping back needs a search
+    if message['id'] in _index:
+        return  # Already picked up by a reload
+    position = 0
+    if _messages and _messages[0]['timestamp'] > message['timestamp']:
+        position = next(
+            (i for i, msg in enumerate(_messages) if msg['timestamp'] <= message['timestamp']),
+            len(_messages)
+        )
+    if position == MAX_MESSAGES:
+        return  # Older than everything kept, the database cleanup drops it as well
+    if len(_messages) == MAX_MESSAGES:
+        del _index[_messages.pop()['id']]
+    _messages.insert(position, message)
+    _index[message['id']] = message
+
+async def refresh_messages():
+    """Reload _messages if the table changed since it was loaded"""
+    global _messages_version
+    async with _db_lock:
+        async with db.execute("PRAGMA data_version") as cursor:
+            version = (await cursor.fetchone())[0]
+        if version != _messages_version:
+            messages = await load_messages()
+            _messages.clear()
+            _messages.extend(messages)
+            _index.clear()
+            _index.update((msg['id'], msg) for msg in messages)
+            _messages_version = version
+            messages_changed()
+    return _messages
+
+async def load_messages(limit=MAX_MESSAGES):
+    """Load the latest messages from the database, newest first"""
+    async with db.execute(
+        "SELECT id, fullName, email, position, message, timestamp, created_at "
+        "FROM messages ORDER BY timestamp DESC LIMIT ?",
+        (limit,)
+    ) as cursor:
+        rows = await cursor.fetchall()
+    return [dict(row) for row in rows]
+
+async def insert_message(message):
+    """Insert a single message and drop anything beyond MAX_MESSAGES"""
+    async with _db_lock:
+        try:
+            await db.execute(
+                "INSERT INTO messages (id, fullName, email, position, message, timestamp, created_at) "
+                "VALUES (:id, :fullName, :email, :position, :message, :timestamp, :created_at)",
+                message
+            )
+            await cleanup_old_messages(MAX_MESSAGES)
+            await db.commit()
+        except Exception:
+            # Leave no open transaction behind, it would pin reads to an old
+            # snapshot and keep every later write locked out
+            await db.rollback()
+            raise
+
+async def remove_message(message_id):
+    """Delete a single message by id, returns True if it existed"""
+    async with _db_lock:
+        try:
+            async with db.execute("DELETE FROM messages WHERE id = ?", (message_id,)) as cursor:
+                removed = cursor.rowcount > 0
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+    return removed
+
+async def trim_messages(keep):
+    """Delete everything but the latest `keep` messages"""
+    async with _db_lock:
+        try:
+            await cleanup_old_messages(keep)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+async def cleanup_old_messages(keep=MAX_MESSAGES):
+    """Keep only the latest `keep` messages, the caller commits"""
+    async with db.execute(
+        "DELETE FROM messages WHERE id NOT IN "
+        "(SELECT id FROM messages ORDER BY timestamp DESC LIMIT ?)",
+        (keep,)
+    ) as cursor:
+        removed = cursor.rowcount
+    if removed > 0:
+        logger.debug("Cleaned up messages. %d old messages removed.", removed)
+    return removed
+
+@asynccontextmanager
+async def lifespan(app):
+    await init_db()
+    yield
+    await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    await db.close()
 
 app = FastAPI(
     title="Portfolio Backend API",
     description="Backend API for portfolio website messages",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_LEVEL)
+
 # CORS Configuration - More specific and secure
 # Pastikan 'https://ficrammanifur.github.io' ada di daftar allow_origins
+# Preflight (OPTIONS) requests are answered by the middleware itself
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -34,206 +337,213 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
-# File untuk menyimpan pesan
-MESSAGES_FILE = 'messages.json'
-MAX_MESSAGES = 10
+# Static parts of the / and /health responses, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Portfolio Backend API - Ficram Manifur Farissa",
+    "version": "1.0.0",
+    "status": "running",
+    "cors_enabled": True,
+    "endpoints": {
+        "GET /api/messages": "Get all messages",
+        "POST /api/messages": "Submit new message",
+        "DELETE /api/messages/{id}": "Delete specific message",
+        "GET /docs": "API Documentation",
+        "GET /health": "Health check"
+    }
+})
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Portfolio Backend API",
+    "cors_enabled": True
+})
 
-def load_messages():
-    """Load messages from JSON file"""
-    if os.path.exists(MESSAGES_FILE):
-        try:
-            with open(MESSAGES_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                print(f"Loaded {len(data)} messages from {MESSAGES_FILE}")
-                return data if isinstance(data, list) else []
-        except json.JSONDecodeError:
-            print(f"Error decoding JSON from {MESSAGES_FILE}. File might be empty or corrupted. Returning empty list.")
-            return []
-        except Exception as e:
-            print(f"Error loading messages from {MESSAGES_FILE}: {e}")
-            return []
-    print(f"{MESSAGES_FILE} not found. Returning empty list.")
-    return []
-
-def save_messages(messages):
-    """Save messages to JSON file"""
-    try:
-        with open(MESSAGES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(messages, f, ensure_ascii=False, indent=2)
-        print(f"Saved {len(messages)} messages to {MESSAGES_FILE}")
-    except Exception as e:
-        print(f"Error saving messages to {MESSAGES_FILE}: {e}")
-
-def cleanup_old_messages(messages):
-    """Keep only the latest MAX_MESSAGES"""
-    if len(messages) > MAX_MESSAGES:
-        messages.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        cleaned_messages = messages[:MAX_MESSAGES]
-        print(f"Cleaned up messages. {len(cleaned_messages)} messages remaining.")
-        return cleaned_messages
-    return messages
-
-# Handle preflight requests explicitly
-@app.options("/{full_path:path}")
-async def options_handler():
-    print(f"OPTIONS request received for path: {full_path}")
-    return {"message": "OK"}
+# (checked at, exists) for the database file, re-checked at most once per second
+_file_exists_cache = (float('-inf'), False)
+
+def extend_body(body, fields):
+    """Append `fields` to a pre-serialized JSON object"""
+    return body[:-1] + b',' + orjson.dumps(fields)[1:]
+
+def database_file_exists():
+    """os.path.exists(DATABASE_FILE), cached for one second"""
+    global _file_exists_cache
+    now = _monotonic()
+    if now - _file_exists_cache[0] >= 1:
+        _file_exists_cache = (now, os.path.exists(DATABASE_FILE))
+    return _file_exists_cache[1]
+
+def etag_matches(if_none_match, etag):
+    """Weak If-None-Match comparison: "*" matches, W/ prefixes are ignored"""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix('W/')
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix('W/') == opaque_tag:
+            return True
+    return False
 
 @app.get("/")
 async def root():
-    print("Root endpoint accessed.")
-    return {
-        "message": "Portfolio Backend API - Ficram Manifur Farissa",
-        "version": "1.0.0",
-        "status": "running",
-        "cors_enabled": True,
-        "timestamp": datetime.now().isoformat(),
-        "endpoints": {
-            "GET /api/messages": "Get all messages",
-            "POST /api/messages": "Submit new message",
-            "DELETE /api/messages/{id}": "Delete specific message",
-            "GET /docs": "API Documentation",
-            "GET /health": "Health check"
-        }
-    }
+    logger.debug("Root endpoint accessed.")
+    body = extend_body(_ROOT_BODY, {"timestamp": _now().isoformat()})
+    return Response(body, media_type="application/json")
 
 @app.get("/api/messages")
-async def get_messages():
+async def get_messages(request: Request):
     """Get all messages"""
-    print("GET /api/messages endpoint accessed.")
+    global _messages_cache
+    logger.debug("GET /api/messages endpoint accessed.")
     try:
-        messages = load_messages()
-        print(f"Returning {len(messages)} messages.")
-        return {
-            "success": True,
-            "messages": messages,
-            "count": len(messages)
-        }
+        messages = await refresh_messages()
+        if _messages_cache is None or _messages_cache[0] != _revision:
+            logger.debug("Returning %d messages.", len(messages))
+            payload = orjson.dumps({
+                "success": True,
+                "messages": list(messages),
+                "count": len(messages)
+            })
+            gzipped = None
+            if len(payload) >= GZIP_MINIMUM_SIZE:
+                gzipped = gzip.compress(payload, compresslevel=GZIP_LEVEL)
+            etag = f'W/"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+            _messages_cache = (_revision, payload, gzipped, etag)
+
+        _, payload, gzipped, etag = _messages_cache
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={
+                "Vary": "Accept-Encoding",
+                "ETag": etag
+            })
+
+        # Hand GZipMiddleware an already compressed body, it passes responses
+        # with Content-Encoding through untouched
+        if gzipped is None:
+            return Response(payload, media_type="application/json", headers={"ETag": etag})
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(gzipped, media_type="application/json", headers={
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+                "ETag": etag
+            })
+        return Response(payload, media_type="application/json", headers={
+            "Vary": "Accept-Encoding",
+            "ETag": etag
+        })
     except Exception as e:
-        print(f"Error in get_messages: {e}")
+        logger.error("Error in get_messages: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/messages")
+# The rate limit runs as a dependency, before the body is validated
+@app.post("/api/messages", dependencies=[Depends(limit_writes)])
 async def submit_message(message_data: MessageCreate):
     """Submit new message"""
-    print("POST /api/messages endpoint accessed.")
+    logger.debug("POST /api/messages endpoint accessed.")
     try:
-        # Load existing messages
-        messages = load_messages()
-        
-        # Create new message
+        # Create new message, created_at is the ISO timestamp without the
+        # "T" separator and microseconds, so no second clock read or strftime
+        timestamp = _now().isoformat()
         new_message = {
-            "id": str(uuid.uuid4()),
-            "fullName": message_data.fullName.strip(),
-            "email": message_data.email.strip().lower(),
-            "position": message_data.position.strip(),
-            "message": message_data.message.strip(),
-            "timestamp": datetime.now().isoformat(),
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "id": str(_uuid4()),
+            "fullName": message_data.fullName,
+            "email": message_data.email,
+            "position": message_data.position,
+            "message": message_data.message,
+            "timestamp": timestamp,
+            "created_at": timestamp[:19].replace('T', ' ')
         }
         
-        # Add to beginning of list (newest first)
-        messages.insert(0, new_message)
-        
-        # Cleanup old messages
-        messages = cleanup_old_messages(messages)
-        
-        # Save messages
-        save_messages(messages)
+        # Respond only after the commit, so an acknowledged message is durable
+        await insert_message(new_message)
+        add_message(new_message)
+        messages_changed()
         
-        print(f"New message added from {new_message['fullName']}")
+        logger.debug("New message added from %s", new_message['fullName'])
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Message submitted successfully",
             "data": new_message
-        }
+        })
         
     except Exception as e:
-        print(f"Error in submit_message: {e}")
+        logger.error("Error in submit_message: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/messages/{message_id}")
 async def delete_message(message_id: str):
     """Delete specific message"""
-    print(f"DELETE /api/messages/{message_id} endpoint accessed.")
+    logger.debug("DELETE /api/messages/%s endpoint accessed.", message_id)
     try:
-        messages = load_messages()
-        
-        # Find and remove message
-        original_count = len(messages)
-        messages = [msg for msg in messages if msg.get('id') != message_id]
-        
-        if len(messages) == original_count:
+        if not await remove_message(message_id):
             raise HTTPException(status_code=404, detail="Message not found")
+
+        message = _index.pop(message_id, None)
+        if message is not None:
+            _messages.remove(message)
+            messages_changed()
         
-        save_messages(messages)
-        
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Message deleted successfully"
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in delete_message: {e}")
+        logger.error("Error in delete_message: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/messages/cleanup")
 async def cleanup_messages():
     """Manual cleanup - keep only latest 5 messages"""
-    print("POST /api/messages/cleanup endpoint accessed.")
+    logger.debug("POST /api/messages/cleanup endpoint accessed.")
     try:
-        messages = load_messages()
+        await trim_messages(5)
+        messages = await refresh_messages()
         
         if len(messages) > 5:
-            messages.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            messages = messages[:5]
-            save_messages(messages)
+            # The deque is already newest first, drop from the old end
+            while len(messages) > 5:
+                del _index[messages.pop()['id']]
+            messages_changed()
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": f"Cleanup completed. {len(messages)} messages remaining"
-        }
+        })
         
     except Exception as e:
-        print(f"Error in cleanup_messages: {e}")
+        logger.error("Error in cleanup_messages: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    print("Health check endpoint accessed.")
-    messages_count = len(load_messages())
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "Portfolio Backend API",
-        "cors_enabled": True,
+    logger.debug("Health check endpoint accessed.")
+    messages_count = len(await refresh_messages())
+    body = extend_body(_HEALTH_BODY, {
+        "timestamp": _now().isoformat(),
         "messages_count": messages_count,
-        "file_exists": os.path.exists(MESSAGES_FILE)
-    }
+        "file_exists": database_file_exists()
+    })
+    return Response(body, media_type="application/json")
 
 @app.get("/test-cors")
 async def test_cors():
     """Test CORS endpoint"""
-    print("Test CORS endpoint accessed.")
-    return {
+    logger.debug("Test CORS endpoint accessed.")
+    return ORJSONResponse({
         "cors_test": "success",
         "origin_allowed": True,
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": _now().isoformat()
+    })
 
 if __name__ == '__main__':
     import uvicorn
     
-    # Create messages file if it doesn't exist
-    if not os.path.exists(MESSAGES_FILE):
-        save_messages([])
-        print("Created empty messages.json file")
-    
     port = int(os.environ.get('PORT', 8000))
-    print(f"Starting Uvicorn server on host 0.0.0.0, port {port}")
-    uvicorn.run("main:app", host='0.0.0.0', port=port, reload=False)
-    print("Uvicorn server stopped.")
+    workers = int(os.environ.get('WEB_CONCURRENCY', (os.cpu_count() or 1) * 2 + 1))
+    logger.info("Starting Uvicorn server on host 0.0.0.0, port %d with %d workers", port, workers)
+    uvicorn.run("main:app", host='0.0.0.0', port=port, reload=False, workers=workers, log_level='warning')
+    logger.info("Uvicorn server stopped.")